@@ -16,6 +16,7 @@ from .const import (
     DOMAIN,
     RADIUS_OPTIONS,
 )
+from .zipcodes import get_county_id, is_valid_zipcode
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +26,8 @@ class DRKBlutspendeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _suggested_zipcode: Optional[str] = None
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> config_entries.FlowResult:
@@ -32,7 +35,24 @@ class DRKBlutspendeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            return self.async_create_entry(title="DRK Blutspende", data=user_input)
+            user_input[CONF_ZIPCODE] = user_input[CONF_ZIPCODE].strip()
+            zipcode = user_input[CONF_ZIPCODE]
+            countyid = get_county_id(zipcode)
+            if not is_valid_zipcode(zipcode):
+                errors[CONF_ZIPCODE] = "invalid_zipcode"
+            elif (
+                countyid
+                and not user_input.get(CONF_COUNTY_ID)
+                and self._suggested_zipcode != zipcode
+            ):
+                # Suggest the county once, the user may still clear or change it
+                _LOGGER.debug("Suggesting county %s for zipcode %s", countyid, zipcode)
+                self._suggested_zipcode = zipcode
+                user_input[CONF_COUNTY_ID] = countyid
+            else:
+                return self.async_create_entry(
+                    title="DRK Blutspende", data=user_input
+                )
 
         data_schema = vol.Schema(
             {
@@ -45,6 +65,9 @@ class DRKBlutspendeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
 
+        if user_input is not None:
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
+
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
         )
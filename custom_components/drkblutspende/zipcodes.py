@@ -0,0 +1,125 @@
+"""Offline lookup of german zipcodes to AGS county keys."""
+
+import re
+from bisect import bisect_right
+from typing import Optional
+
+ZIP_PATTERN = re.compile(r"\d{5}", re.ASCII)
+
+# Allocated zipcode ranges, lowest is 01067 and highest is 99998.
+# Leitregionen 00, 05, 43 and 62 are not in use. This is a coarse check,
+# not every zipcode within these ranges actually exists.
+ZIP_REGIONS: list[tuple[int, int]] = [
+    (1067, 4999),
+    (6000, 42999),
+    (44000, 61999),
+    (63000, 99998),
+]
+
+# Zipcode ranges that lie completely within one county, sorted by start.
+# Zipcodes that are shared between several counties are left out on purpose.
+ZIP_COUNTY_RANGES: list[tuple[int, int, str]] = [
+    (1067, 1328, "14612"),  # Dresden
+    (4103, 4357, "14713"),  # Leipzig
+    (6108, 6132, "15002"),  # Halle (Saale)
+    (9111, 9131, "14511"),  # Chemnitz
+    (10115, 12527, "11000"),  # Berlin
+    (12555, 13629, "11000"),  # Berlin
+    (14050, 14199, "11000"),  # Berlin
+    (18055, 18057, "13003"),  # Rostock
+    (18106, 18106, "13003"),  # Rostock
+    (18109, 18109, "13003"),  # Rostock
+    (18119, 18119, "13003"),  # Rostock
+    (18146, 18147, "13003"),  # Rostock
+    (20095, 20539, "02000"),  # Hamburg
+    (22041, 22111, "02000"),  # Hamburg
+    (22115, 22143, "02000"),  # Hamburg
+    (22147, 22769, "02000"),  # Hamburg
+    (23552, 23570, "01003"),  # Lübeck
+    (24103, 24106, "01002"),  # Kiel
+    (24111, 24111, "01002"),  # Kiel
+    (24114, 24118, "01002"),  # Kiel
+    (24143, 24159, "01002"),  # Kiel
+    (28195, 28779, "04011"),  # Bremen
+    (30159, 30669, "03241"),  # Hannover
+    (33602, 33739, "05711"),  # Bielefeld
+    (34117, 34134, "06611"),  # Kassel
+    (38100, 38126, "03101"),  # Braunschweig
+    (39104, 39130, "15003"),  # Magdeburg
+    (40210, 40629, "05111"),  # Düsseldorf
+    (44135, 44388, "05913"),  # Dortmund
+    (45127, 45359, "05113"),  # Essen
+    (48143, 48167, "05515"),  # Münster
+    (50667, 51149, "05315"),  # Köln
+    (52062, 52080, "05334"),  # Aachen
+    (53111, 53229, "05314"),  # Bonn
+    (55116, 55131, "07315"),  # Mainz
+    (60306, 60599, "06412"),  # Frankfurt am Main
+    (65183, 65207, "06414"),  # Wiesbaden
+    (66111, 66133, "10041"),  # Saarbrücken
+    (68159, 68309, "08222"),  # Mannheim
+    (70173, 70619, "08111"),  # Stuttgart
+    (76131, 76229, "08212"),  # Karlsruhe
+    (79098, 79117, "08311"),  # Freiburg im Breisgau
+    (80331, 81929, "09162"),  # München
+    (86150, 86199, "09761"),  # Augsburg
+    (90402, 90491, "09564"),  # Nürnberg
+    (93047, 93059, "09362"),  # Regensburg
+    (97070, 97084, "09663"),  # Würzburg
+    (99084, 99099, "16051"),  # Erfurt
+]
+
+
+def _check_ranges(ranges: list[tuple]) -> None:
+    """Make sure ranges are well formed, sorted and do not overlap."""
+    for start, end, *_ in ranges:
+        assert start <= end, f"Invalid zipcode range {start}-{end}"
+    for current, following in zip(ranges, ranges[1:]):
+        assert current[1] < following[0], (
+            f"Zipcode ranges {current[0]}-{current[1]} and "
+            f"{following[0]}-{following[1]} are unsorted or overlap"
+        )
+
+
+_check_ranges(ZIP_REGIONS)
+_check_ranges(ZIP_COUNTY_RANGES)
+
+_REGION_STARTS = [start for start, _ in ZIP_REGIONS]
+_REGION_ENDS = [end for _, end in ZIP_REGIONS]
+_COUNTY_STARTS = [start for start, _, _ in ZIP_COUNTY_RANGES]
+_COUNTY_ENDS = [end for _, end, _ in ZIP_COUNTY_RANGES]
+_COUNTY_IDS = [countyid for _, _, countyid in ZIP_COUNTY_RANGES]
+
+
+def _find_range(starts: list[int], ends: list[int], zipcode: int) -> Optional[int]:
+    """Return the index of the range containing zipcode, if any."""
+    index = bisect_right(starts, zipcode) - 1
+    if index >= 0 and zipcode <= ends[index]:
+        return index
+    return None
+
+
+def _parse_zipcode(zipcode: str) -> Optional[int]:
+    """Convert a zipcode string into an int, None if it is malformed."""
+    if not ZIP_PATTERN.fullmatch(zipcode):
+        return None
+    return int(zipcode)
+
+
+def is_valid_zipcode(zipcode: str) -> bool:
+    """Check if zipcode is well formed and within an allocated range."""
+    number = _parse_zipcode(zipcode)
+    if number is None:
+        return False
+    return _find_range(_REGION_STARTS, _REGION_ENDS, number) is not None
+
+
+def get_county_id(zipcode: str) -> Optional[str]:
+    """Get the AGS county key for zipcode, None if it is not known."""
+    number = _parse_zipcode(zipcode)
+    if number is None:
+        return None
+    index = _find_range(_COUNTY_STARTS, _COUNTY_ENDS, number)
+    if index is None:
+        return None
+    return _COUNTY_IDS[index]
@@ -0,0 +1,81 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+COMPONENT = Path(__file__).parent.parent / "custom_components" / "drkblutspende"
+
+
+def load_module(name: str):
+    """Load a module of the component without importing homeassistant."""
+    spec = importlib.util.spec_from_file_location(name, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+zipcodes = load_module("zipcodes")
+const = load_module("const")
+
+
+@pytest.mark.parametrize(
+    "zipcode",
+    [
+        "",
+        "1234",
+        "123456",
+        "abcde",
+        "8033a",
+        " 80331",
+        "80331 ",
+        "８０３３１",
+        "00123",
+        "01066",
+        "05123",
+        "43123",
+        "62123",
+        "99999",
+    ],
+)
+def test_invalid_zipcode(zipcode):
+    assert not zipcodes.is_valid_zipcode(zipcode)
+    assert zipcodes.get_county_id(zipcode) is None
+
+
+@pytest.mark.parametrize("zipcode", ["01067", "79790", "80331", "99998"])
+def test_valid_zipcode(zipcode):
+    assert zipcodes.is_valid_zipcode(zipcode)
+
+
+@pytest.mark.parametrize("start, end, countyid", zipcodes.ZIP_COUNTY_RANGES)
+def test_county_range_edges(start, end, countyid):
+    assert zipcodes.get_county_id(f"{start:05d}") == countyid
+    assert zipcodes.get_county_id(f"{end:05d}") == countyid
+    assert zipcodes.get_county_id(f"{start - 1:05d}") != countyid
+    assert zipcodes.get_county_id(f"{end + 1:05d}") != countyid
+
+
+@pytest.mark.parametrize("zipcode", ["18059", "18069", "18107", "24113", "24119", "79790"])
+def test_unknown_county(zipcode):
+    assert zipcodes.is_valid_zipcode(zipcode)
+    assert zipcodes.get_county_id(zipcode) is None
+
+
+def test_county_ids_are_options():
+    for _, _, countyid in zipcodes.ZIP_COUNTY_RANGES:
+        assert countyid in const.COUNTY_OPTIONS
+
+
+def test_county_ranges_within_regions():
+    for start, end, _ in zipcodes.ZIP_COUNTY_RANGES:
+        assert zipcodes.is_valid_zipcode(f"{start:05d}")
+        assert zipcodes.is_valid_zipcode(f"{end:05d}")
+
+
+def test_check_ranges_rejects_overlap():
+    with pytest.raises(AssertionError):
+        zipcodes._check_ranges([(100, 200, "a"), (150, 300, "b")])
+    with pytest.raises(AssertionError):
+        zipcodes._check_ranges([(300, 400, "a"), (100, 200, "b")])
+    with pytest.raises(AssertionError):
+        zipcodes._check_ranges([(200, 100, "a")])